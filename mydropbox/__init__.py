@@ -11,32 +11,72 @@ __version__ = "0.1.0"
 __author__ = "Raphaël Bajon"
 __license__ = "MIT"
 
-# Import project management
-from .project import ProjectPaths, create_project
-# Import dropbox management
-from .dropbox import get_dropbox, DropboxPaths, PersonalPaths, GroupPaths 
-from .dropbox.utils import check_sync_status, auto_discover_paths
-
-from .config.loadconfig import _load_config
+import importlib
+from types import ModuleType
 
 __all__ = [
     "ProjectPaths",
     "create_project",
+    "create_projects",
     "get_dropbox",
     "DropboxPaths",
     "PersonalPaths",
     "GroupPaths",
-    "check_sync_status", 
+    "check_sync_status",
+    "check_sync_status_many",
+    "watch_sync_status",
     "auto_discover_paths"
 ]
 
+# Public names and the submodules that provide them; resolved on first
+# access so `import mydropbox` pulls in no submodules at all.
+_LAZY_IMPORTS = {
+    # Project management
+    "ProjectPaths": ".project",
+    "create_project": ".project",
+    "create_projects": ".project",
+    # Dropbox management
+    "get_dropbox": ".dropbox",
+    "DropboxPaths": ".dropbox",
+    "PersonalPaths": ".dropbox",
+    "GroupPaths": ".dropbox",
+    "check_sync_status": ".dropbox.utils",
+    "check_sync_status_many": ".dropbox.utils",
+    "watch_sync_status": ".dropbox.utils",
+    "auto_discover_paths": ".dropbox.utils",
+}
+
+
+def __getattr__(name):
+    """Resolve public names and the default dropbox instance lazily (PEP 562)."""
+    if name == "dropbox":
+        from .config.loadconfig import _load_config
+        from .dropbox import get_dropbox
+
+        _config = _load_config()
+        instance = get_dropbox(
+            base_path=_config["base_path"],
+            personal_folder=_config["personal_folder"]
+        )
+        # Bind after the subpackage import so the instance wins the
+        # 'dropbox' name, as the old eager assignment did.
+        globals()["dropbox"] = instance
+        return instance
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        # Importing the .dropbox subpackage binds it onto this module as
+        # 'dropbox', which would shadow the lazy default instance above;
+        # unbind it so the name == "dropbox" branch keeps working.
+        if isinstance(globals().get("dropbox"), ModuleType):
+            del globals()["dropbox"]
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-# Initialize default dropbox instance
-_config = _load_config()
-dropbox = get_dropbox(
-    base_path=_config["base_path"],
-    personal_folder=_config["personal_folder"]
-)
+def __dir__():
+    return sorted(set(list(globals()) + __all__ + ["dropbox"]))
 
 
 if __name__ == "__main__":
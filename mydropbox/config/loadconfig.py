@@ -1,64 +1,80 @@
-import sys
+import importlib.util
 import os
+from functools import lru_cache
 from pathlib import Path
-import json
 
 
-def _find_config_file():
-    """Find configuration file. Returns (path, type) or (None, None)."""
-    search_locations = [
+def _build_search_locations():
+    """Build the ordered list of config file candidates (built once at import)."""
+    cwd = os.getcwd()
+    home = os.path.expanduser("~")
+    package_parent = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+
+    locations = (
         # Python configs (higher priority)
-        (Path.cwd() / "mydropbox_config.py", "python"),
-        (Path.home() / ".mydropbox_config.py", "python"),
-        (Path(__file__).parent.parent / "mydropbox_config.py", "python"),
-        (Path(__file__).parent / "mydropbox_config.py", "python"),  # Inside package directory
+        (os.path.join(cwd, "mydropbox_config.py"), "python"),
+        (os.path.join(home, ".mydropbox_config.py"), "python"),
+        (os.path.join(package_parent, "mydropbox_config.py"), "python"),
+        (os.path.join(package_dir, "mydropbox_config.py"), "python"),  # Inside package directory
         # JSON configs
-        (Path.cwd() / "mydropbox_config.json", "json"),
-        (Path.home() / ".mydropbox_config.json", "json"),
-        (Path(__file__).parent.parent / "mydropbox_config.json", "json"),
-        (Path(__file__).parent / "mydropbox_config.json", "json"),  # Inside package directory
+        (os.path.join(cwd, "mydropbox_config.json"), "json"),
+        (os.path.join(home, ".mydropbox_config.json"), "json"),
+        (os.path.join(package_parent, "mydropbox_config.json"), "json"),
+        (os.path.join(package_dir, "mydropbox_config.json"), "json"),  # Inside package directory
         # Templates (lowest priority)
-        (Path.cwd() / "mydropbox_config_template.py", "python"),
-        (Path(__file__).parent.parent / "mydropbox_config_template.py", "python"),
-        (Path(__file__).parent / "mydropbox_config_template.py", "python"),  # Inside package directory
-        (Path.cwd() / "mydropbox_config_template.json", "json"),
-        (Path(__file__).parent.parent / "mydropbox_config_template.json", "json"),
-        (Path(__file__).parent / "mydropbox_config_template.json", "json"),  # Inside package directory
-    ]
-
-    for path, config_type in search_locations:
-        if path.exists() and path.is_file():
-            return path, config_type
+        (os.path.join(cwd, "mydropbox_config_template.py"), "python"),
+        (os.path.join(package_parent, "mydropbox_config_template.py"), "python"),
+        (os.path.join(package_dir, "mydropbox_config_template.py"), "python"),  # Inside package directory
+        (os.path.join(cwd, "mydropbox_config_template.json"), "json"),
+        (os.path.join(package_parent, "mydropbox_config_template.json"), "json"),
+        (os.path.join(package_dir, "mydropbox_config_template.json"), "json"),  # Inside package directory
+    )
+
+    # Drop duplicate paths (cwd can overlap home or the package dir in dev
+    # installs), keeping the first -- highest priority -- occurrence
+    seen = set()
+    return tuple(
+        (location, config_type)
+        for location, config_type in locations
+        if location not in seen and not seen.add(location)
+    )
+
+
+_SEARCH_LOCATIONS = _build_search_locations()
+
+
+def _find_config_file():
+    """Find configuration file. Returns (path, type) or (None, None)."""
+    for location, config_type in _SEARCH_LOCATIONS:
+        if os.path.isfile(location):
+            return Path(location), config_type
 
     return None, None
 
 
 def _load_python_config(config_path):
     """Load config from Python file. Returns dict or None."""
-    config_dir = str(config_path.parent)
-    if config_dir not in sys.path:
-        sys.path.insert(0, config_dir)
-        cleanup_path = True
-    else:
-        cleanup_path = False
-
     try:
-        module_name = config_path.stem
-        config_module = __import__(module_name)
+        spec = importlib.util.spec_from_file_location(config_path.stem, config_path)
+        if spec is None or spec.loader is None:
+            return None
+
+        config_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(config_module)
 
         return {
             "personal_folder": getattr(config_module, "PERSONAL_FOLDER", None),
             "base_path": getattr(config_module, "DROPBOX_BASE_PATH", None),
         }
-    except (ImportError, AttributeError):
+    except (ImportError, OSError, SyntaxError):
         return None
-    finally:
-        if cleanup_path:
-            sys.path.remove(config_dir)
 
 
 def _load_json_config(config_path):
     """Load config from JSON file. Returns dict or None."""
+    import json  # Deferred: Python-config users never pay the import cost
+
     try:
         with open(config_path, 'r') as f:
             data = json.load(f)
@@ -67,10 +83,11 @@ def _load_json_config(config_path):
             "personal_folder": data.get("personal_folder"),
             "base_path": data.get("dropbox_base_path"),
         }
-    except (json.JSONDecodeError, IOError, KeyError):
+    except (json.JSONDecodeError, OSError):
         return None
 
 
+@lru_cache(maxsize=1)
 def _load_config():
     """
     Load configuration from available sources.
@@ -80,6 +97,10 @@ def _load_config():
     2. Config files (Python or JSON)
     3. Defaults (None)
 
+    The result is cached, so only the first call pays for the file search.
+    Call `_load_config.cache_clear()` to force a reload (e.g. after changing
+    environment variables or config files).
+
     Returns:
         dict: {'personal_folder': str or None, 'base_path': str or None}
     """
@@ -89,20 +110,21 @@ def _load_config():
         "base_path": os.getenv("MYDROPBOX_BASE_PATH"),
     }
 
-    # If not fully configured, try config file
-    if not config["personal_folder"] or not config["base_path"]:
-        config_path, config_type = _find_config_file()
-        print('finding config')
-        print(config_path, config_type)
-        if config_path and config_type:
-            file_config = (
-                _load_python_config(config_path) if config_type == "python"
-                else _load_json_config(config_path)
-            )
-
-            if file_config:
-                # Use file values only if not set by environment
-                config["personal_folder"] = config["personal_folder"] or file_config.get("personal_folder")
-                config["base_path"] = config["base_path"] or file_config.get("base_path")
+    # Fully configured from the environment: skip the file search entirely
+    if config["personal_folder"] and config["base_path"]:
+        return config
+
+    # Not fully configured, try config file
+    config_path, config_type = _find_config_file()
+    if config_path and config_type:
+        file_config = (
+            _load_python_config(config_path) if config_type == "python"
+            else _load_json_config(config_path)
+        )
+
+        if file_config:
+            # Use file values only if not set by environment
+            config["personal_folder"] = config["personal_folder"] or file_config.get("personal_folder")
+            config["base_path"] = config["base_path"] or file_config.get("base_path")
 
     return config
\ No newline at end of file
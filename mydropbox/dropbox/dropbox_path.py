@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import os
@@ -5,6 +6,36 @@ import os
 from .group_path import GroupPaths
 from .personal_path import PersonalPaths
 
+# Name of the shared group folder inside Dropbox
+_GROUP_FOLDER_NAME = "UHM_Ocean_BGC_Group Dropbox"
+
+
+@lru_cache(maxsize=1)
+def _detect_base() -> Path:
+    """
+    Auto-detect the Dropbox base path from common locations.
+
+    The result is cached so repeated instantiations skip the filesystem
+    probes; call `_detect_base.cache_clear()` to force re-detection.
+    """
+    home = os.path.expanduser("~")
+
+    # Try common Dropbox locations; candidates stay plain strings so each
+    # probe is a single os.path.isdir without Path construction overhead
+    possible_paths = (
+        os.path.join(home, _GROUP_FOLDER_NAME),
+        os.path.join(home, "Dropbox", _GROUP_FOLDER_NAME),
+        os.path.join(home, "Library", "CloudStorage", "Dropbox", _GROUP_FOLDER_NAME),
+    )
+
+    for path in possible_paths:
+        # The base must be a directory; isdir also rejects stray files
+        if os.path.isdir(path):
+            return Path(path)
+
+    # Default fallback
+    return Path(possible_paths[1])
+
 
 class DropboxPaths:
     """
@@ -28,21 +59,7 @@ class DropboxPaths:
                            Example: "Raphaël Bajon", "John Doe", etc.
         """
         if base_path is None:
-            # Try common Dropbox locations
-            possible_paths = [
-                Path.home() / "UHM_Ocean_BGC_Group Dropbox",
-                Path.home() / "Dropbox" / "UHM_Ocean_BGC_Group Dropbox",
-                Path.home() / "Library" / "CloudStorage" / "Dropbox" / "UHM_Ocean_BGC_Group Dropbox",
-                Path("/Users") / os.getenv("USER", "") / "Dropbox" / "UHM_Ocean_BGC_Group Dropbox"
-            ]
-
-            for path in possible_paths:
-                if path.exists():
-                    self.base_path = path
-                    break
-            else:
-                # Default fallback
-                self.base_path = Path.home() / "Dropbox" / "UHM_Ocean_BGC_Group Dropbox"
+            self.base_path = _detect_base()
         else:
             self.base_path = Path(base_path)
 
@@ -61,10 +78,16 @@ class DropboxPaths:
 
 
 # Convenience function for quick access
+@lru_cache(maxsize=16)
 def get_dropbox(base_path: Optional[str] = None, personal_folder: Optional[str] = None) -> DropboxPaths:
     """
     Convenience function to get a DropboxPaths instance.
 
+    Calls with the same arguments return the same cached instance, so
+    repeated calls in notebooks and scripts are free. Treat the returned
+    object as read-only; use `get_dropbox.cache_clear()` to drop the
+    cached instances.
+
     Args:
         base_path: Optional custom base path
         personal_folder: Name of your personal folder (e.g., "Your Name")
@@ -16,45 +16,48 @@ class GroupPaths:
     This class wraps a Path object and automatically discovers all subdirectories,
     making them accessible as attributes. Behaves like a Path through delegation.
     """
-    
+
+    __slots__ = ("_path", "_discovered")
+
     def __init__(self, base_path):
         """
-        Initialize group paths with auto-discovery.
-        
+        Initialize group paths with lazy auto-discovery.
+
         Args:
             base_path: Base path to the group Dropbox folder
         """
-        # Store the path
+        # Store the path; folders are discovered on first attribute access
         self._path = Path(base_path)
-        
-        # Auto-discover all folders
-        self._discover_all_paths()
-    
-    def _discover_all_paths(self):
-        """Automatically discover and add all subdirectories as attributes."""
+        self._discovered = None
+
+    def _discover_all_paths(self) -> Dict[str, Path]:
+        """Discover all subdirectories on first use and cache the result."""
         from .utils import auto_discover_paths
-        
-        # Discover all folders (only immediate children, depth=1)
-        discovered = auto_discover_paths(self._path, max_depth=1)
-        
-        # Add all paths as attributes
-        for attr_name, path in discovered.items():
-            setattr(self, attr_name, path)
-    
+
+        if self._discovered is None:
+            # Discover all folders (only immediate children, depth=1)
+            self._discovered = auto_discover_paths(self._path, max_depth=1)
+        return self._discovered
+
+    def __getattr__(self, name):
+        """Resolve discovered folder names as attributes on demand."""
+        # Guard only the internal slots (recursion) and dunder probes;
+        # discovered names may start with '_' (e.g. dated folders like
+        # "2023_06 ..." sanitize to "_06_..._2023")
+        if name not in GroupPaths.__slots__ and not name.startswith('__'):
+            discovered = self._discover_all_paths()
+            if name in discovered:
+                return discovered[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
     def get_all_paths(self) -> Dict[str, Path]:
         """
         Get all available paths as a dictionary.
-        
+
         Returns:
             Dictionary mapping attribute names to Path objects
         """
-        return {
-            name: getattr(self, name)
-            for name in dir(self)
-            if not name.startswith('_') 
-            and name != 'get_all_paths'
-            and isinstance(getattr(self, name), Path)
-        }
+        return dict(self._discover_all_paths())
     
     # Delegate Path methods to self._path
     def __truediv__(self, other):
@@ -5,11 +5,27 @@ Includes functions for checking Dropbox sync status, auto-discovering paths,
 and converting folders to project structures.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, Optional, List, Dict
 import subprocess
 import platform
 import os
+import re
+import stat as stat_module
+
+# Matches runs of characters that may not appear in an attribute name
+# (anything non-alphanumeric), plus underscore runs so they collapse too
+_SANITIZE_PATTERN = re.compile(r'[\W_]+')
+
+# Dropbox marks files with attributes like com.dropbox.attrs; checking the
+# few realistic casings directly avoids a .lower() allocation per attribute
+_DROPBOX_TOKENS = ('dropbox', 'Dropbox', 'DROPBOX')
+
+# Sync-status results keyed by (st_dev, st_ino, st_mtime_ns); any change to
+# the file bumps mtime and naturally invalidates its entry
+_SYNC_STATUS_CACHE: Dict[tuple, Dict[str, bool]] = {}
+_SYNC_STATUS_CACHE_MAX = 4096
 
 
 def check_sync_status(path: Union[str, Path], download_if_online: bool = False) -> Dict[str, any]:
@@ -53,33 +69,39 @@ def check_sync_status(path: Union[str, Path], download_if_online: bool = False)
         'downloaded': False,
     }
     
-    # Check if path exists at all
-    if not path.exists():
+    # Check if path exists at all (stat also provides the cache key)
+    try:
+        path_stat = os.stat(path)
+    except OSError:
         result['error'] = "Path does not exist"
         return result
-    
+
     result['exists_locally'] = True
-    
-    # Get platform-specific Dropbox attributes
-    system = platform.system()
-    
+
+    cache_key = (path_stat.st_dev, path_stat.st_ino, path_stat.st_mtime_ns)
+
     try:
-        if system == "Darwin":  # macOS
-            # Check extended attributes for Dropbox status
-            result.update(_check_sync_macos(path))
-            
-        elif system == "Windows":
-            # Check file attributes on Windows
-            result.update(_check_sync_windows(path))
-            
-        elif system == "Linux":
-            # Check extended attributes on Linux
-            result.update(_check_sync_linux(path))
-            
+        cached = _SYNC_STATUS_CACHE.get(cache_key)
+        if cached is not None:
+            result.update(cached)
+
+        elif _SYNC_IMPL is not None:
+            # Platform-specific Dropbox attribute check, resolved at import
+            result.update(_SYNC_IMPL(path, path_stat))
+
         else:
-            result['error'] = f"Unsupported platform: {system}"
+            result['error'] = f"Unsupported platform: {platform.system()}"
             return result
-        
+
+        if cached is None:
+            if len(_SYNC_STATUS_CACHE) >= _SYNC_STATUS_CACHE_MAX:
+                _SYNC_STATUS_CACHE.clear()
+            _SYNC_STATUS_CACHE[cache_key] = {
+                'is_synced': result['is_synced'],
+                'is_online_only': result['is_online_only'],
+                'is_syncing': result['is_syncing'],
+            }
+
         # If download requested and file is online-only, trigger download
         if download_if_online and result['is_online_only']:
             success = _trigger_download(path)
@@ -87,41 +109,133 @@ def check_sync_status(path: Union[str, Path], download_if_online: bool = False)
             if success:
                 result['is_syncing'] = True
                 result['is_online_only'] = False
-                
+                # Sync state changed; drop the now-stale cache entry
+                _SYNC_STATUS_CACHE.pop(cache_key, None)
+
     except Exception as e:
         result['error'] = str(e)
-    
+
     return result
 
 
-def _check_sync_macos(path: Path) -> Dict[str, bool]:
-    """Check Dropbox sync status on macOS using xattr."""
+def check_sync_status_many(paths, download_if_online: bool = False,
+                           max_workers: Optional[int] = None) -> List[Dict[str, any]]:
+    """
+    Check sync status for many paths concurrently.
+
+    The per-path work is almost entirely syscall latency (stat/xattr), which
+    releases the GIL, so a thread pool overlaps the waits — worthwhile on
+    cold Dropbox trees where each probe can stall on the sync daemon.
+
+    Args:
+        paths: Iterable of paths to check
+        download_if_online: If True, attempt to download online-only content
+        max_workers: Thread count (default: min(32, 4 x CPU count))
+
+    Returns:
+        List of status dictionaries, in the same order as `paths`
+        (see `check_sync_status` for the dictionary layout)
+
+    Example:
+        >>> statuses = check_sync_status_many(dropbox.personal.datasets.iterdir())
+        >>> online_only = [s['path'] for s in statuses if s['is_online_only']]
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    paths = list(paths)
+    if not paths:
+        return []
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda p: check_sync_status(p, download_if_online=download_if_online),
+            paths,
+        ))
+
+
+def watch_sync_status(paths, interval: float = 1.0, download_if_online: bool = False):
+    """
+    Poll sync status for a set of paths, yielding one batch per cycle.
+
+    Useful for progress loops while Dropbox downloads a tree. Each cycle
+    probes all paths concurrently (see `check_sync_status_many`); files
+    whose metadata has not changed are answered from the sync-status
+    cache, so idle cycles cost one stat per path. The generator runs
+    until the caller stops iterating.
+
+    Args:
+        paths: Iterable of paths to watch
+        interval: Seconds to sleep between cycles
+        download_if_online: If True, trigger downloads of online-only content
+
+    Yields:
+        List of status dictionaries, one per path, each cycle
+
+    Example:
+        >>> for statuses in watch_sync_status(files, interval=2.0):
+        ...     if all(s['is_synced'] for s in statuses):
+        ...         break
+    """
+    import time
+
+    paths = list(paths)
+    while True:
+        yield check_sync_status_many(paths, download_if_online=download_if_online)
+        time.sleep(interval)
+
+
+def _listxattr(path: Path) -> List[str]:
+    """
+    List extended attribute names for a path.
+
+    Uses the stdlib os.listxattr where available (Linux); on platforms
+    without it (macOS) the third-party xattr package is used. May raise
+    ImportError or OSError, which callers treat as "fall back".
+    """
+    if hasattr(os, "listxattr"):
+        return os.listxattr(path, follow_symlinks=False)
+
+    import xattr
+    return [
+        attr.decode(errors='replace') if isinstance(attr, bytes) else attr
+        for attr in xattr.xattr(path)
+    ]
+
+
+def _check_sync_xattr(path: Path, path_stat=None) -> Dict[str, bool]:
+    """Check Dropbox sync status via extended attributes (macOS and Linux)."""
     try:
-        import xattr
-        
         # Dropbox uses extended attributes to mark file status
         # com.dropbox.attributes contains sync status
-        attrs = xattr.xattr(path)
-        
+        attrs = _listxattr(path)
+
         # Check for Dropbox-specific attributes
-        dropbox_attrs = [attr for attr in attrs if b'dropbox' in attr.lower()]
-        
+        has_dropbox_attrs = any(
+            token in attr for attr in attrs for token in _DROPBOX_TOKENS
+        )
+
+        # Reuse the caller's stat so type and size cost no extra syscalls
+        if path_stat is None:
+            path_stat = os.stat(path)
+
         # If file has content, it's synced
         # Online-only files have minimal local presence
-        if path.is_file():
-            size = path.stat().st_size
+        if stat_module.S_ISREG(path_stat.st_mode):
             # Files < 1KB are likely placeholders (online-only)
-            is_online_only = size < 1024 and len(dropbox_attrs) > 0
+            is_online_only = path_stat.st_size < 1024 and has_dropbox_attrs
         else:
             # For directories, check if children are accessible
             is_online_only = False
-            
+
         return {
             'is_synced': not is_online_only,
             'is_online_only': is_online_only,
             'is_syncing': False,
         }
-        
+
     except ImportError:
         # xattr not available, fall back to file size check
         return _check_sync_fallback(path)
@@ -129,7 +243,7 @@ def _check_sync_macos(path: Path) -> Dict[str, bool]:
         return _check_sync_fallback(path)
 
 
-def _check_sync_windows(path: Path) -> Dict[str, bool]:
+def _check_sync_windows(path: Path, path_stat=None) -> Dict[str, bool]:
     """Check Dropbox sync status on Windows."""
     try:
         import win32api
@@ -154,31 +268,14 @@ def _check_sync_windows(path: Path) -> Dict[str, bool]:
         return _check_sync_fallback(path)
 
 
-def _check_sync_linux(path: Path) -> Dict[str, bool]:
-    """Check Dropbox sync status on Linux using extended attributes."""
-    try:
-        import xattr
-        
-        attrs = xattr.xattr(path)
-        dropbox_attrs = [attr for attr in attrs if b'dropbox' in attr.lower()]
-        
-        # Similar logic to macOS
-        if path.is_file():
-            size = path.stat().st_size
-            is_online_only = size < 1024 and len(dropbox_attrs) > 0
-        else:
-            is_online_only = False
-            
-        return {
-            'is_synced': not is_online_only,
-            'is_online_only': is_online_only,
-            'is_syncing': False,
-        }
-        
-    except ImportError:
-        return _check_sync_fallback(path)
-    except Exception:
-        return _check_sync_fallback(path)
+# Platform dispatch resolved once at import so the hot path avoids both the
+# platform.system() call and the if/elif tower per check; macOS and Linux
+# share the xattr backend
+_SYNC_IMPL = {
+    'Darwin': _check_sync_xattr,
+    'Windows': _check_sync_windows,
+    'Linux': _check_sync_xattr,
+}.get(platform.system())
 
 
 def _check_sync_fallback(path: Path) -> Dict[str, bool]:
@@ -188,21 +285,24 @@ def _check_sync_fallback(path: Path) -> Dict[str, bool]:
     """
     try:
         if path.is_file():
-            # Try to read first byte to ensure file is accessible
-            with open(path, 'rb') as f:
-                f.read(1)
-            is_synced = True
+            # Probe readability without opening the file: an open would
+            # force Dropbox to download an online-only placeholder just
+            # to answer a status question
+            is_synced = os.access(path, os.R_OK)
         else:
-            # For directories, check if we can list contents
-            list(path.iterdir())
+            # For directories, opening the listing is enough to prove
+            # accessibility -- no need to stat every child like iterdir
+            with os.scandir(path) as entries:
+                next(entries, None)
             is_synced = True
             
         return {
             'is_synced': is_synced,
-            'is_online_only': False,
+            # If we can't read it, assume online-only (same as the error path)
+            'is_online_only': not is_synced,
             'is_syncing': False,
         }
-        
+
     except (OSError, PermissionError):
         # If we can't access it, assume online-only
         return {
@@ -265,36 +365,29 @@ def auto_discover_paths(base_path: Union[str, Path], max_depth: int = 2) -> Dict
     """
     base_path = Path(base_path)
     discovered = {}
-    
-    if not base_path.exists() or not base_path.is_dir():
+
+    if not base_path.is_dir():
         return discovered
-    
-    def _scan_directory(directory: Path, current_depth: int = 1):
-        """Recursively scan directory up to max_depth."""
-        if current_depth > max_depth:
-            return
-        
-        try:
-            for item in directory.iterdir():
-                if item.is_dir():
-                    # Convert folder name to valid attribute name
-                    attr_name = _path_to_attribute_name(item.name)
-                    
-                    # Store path
-                    discovered[attr_name] = item
-                    
-                    # Recurse if not at max depth
-                    if current_depth < max_depth:
-                        _scan_directory(item, current_depth + 1)
-                        
-        except PermissionError:
-            # Skip directories we can't access
-            pass
-    
-    _scan_directory(base_path)
+
+    # Iterative walk: os.walk scans each level in C (reusing d_type, so no
+    # per-entry stat) and pruning dirs[:] in place caps the depth;
+    # unreadable directories are silently skipped by default
+    base_depth = len(base_path.parts)
+    for root, dirs, _files in os.walk(base_path, followlinks=False):
+        root_path = Path(root)
+        for dir_name in dirs:
+            # Convert folder name to valid attribute name
+            attr_name = _path_to_attribute_name(dir_name)
+            discovered[attr_name] = root_path / dir_name
+
+        # Children of this level sit at (depth of root - base) + 1
+        if len(root_path.parts) - base_depth + 1 >= max_depth:
+            dirs[:] = []
+
     return discovered
 
 
+@lru_cache(maxsize=8192)
 def _path_to_attribute_name(name: str) -> str:
     """
     Convert a folder name to a valid Python attribute name.
@@ -310,20 +403,10 @@ def _path_to_attribute_name(name: str) -> str:
         "Lab_Field_Data" -> "lab_field_data"
         "2023_06 SeAjusted pCO2" -> "seajusted_pco2_2023_06"
     """
-    # Convert to lowercase
-    name = name.lower()
-    
-    # Replace spaces and special chars with underscore
-    name = name.replace(' ', '_')
-    name = name.replace('-', '_')
-    name = ''.join(c if c.isalnum() or c == '_' else '_' for c in name)
-    
-    # Remove multiple consecutive underscores
-    while '__' in name:
-        name = name.replace('__', '_')
-    
-    # Remove leading/trailing underscores
-    name = name.strip('_')
+    # Lowercase, replace special-char/space/underscore runs with a single
+    # underscore, and strip the ends -- one C-level regex pass instead of
+    # several string passes and a per-character generator
+    name = _SANITIZE_PATTERN.sub('_', name.lower()).strip('_')
     
     # If starts with number, move it to end
     if name and name[0].isdigit():
@@ -363,24 +446,37 @@ def create_dynamic_path_class(base_path: Union[str, Path],
         >>> group.collaborative_projects
     """
     base_path = Path(base_path)
-    discovered = auto_discover_paths(base_path, max_depth=max_depth)
-    
-    # Create a dynamic class
+
+    # Create a dynamic class; the filesystem scan is deferred until the
+    # first attribute access so construction costs nothing
     class DynamicPaths:
+        __slots__ = ("base", "_index")
+
         def __init__(self):
             self.base = base_path
-            
-            # Add all discovered paths as attributes
-            for attr_name, path in discovered.items():
-                setattr(self, attr_name, path)
-        
+            self._index = None
+
+        def _discover(self) -> Dict[str, Path]:
+            """Scan the base directory on first use and cache the result."""
+            if self._index is None:
+                self._index = auto_discover_paths(self.base, max_depth=max_depth)
+            return self._index
+
+        def __getattr__(self, name):
+            # Discovered names may start with '_' (dated folders); only
+            # the internal slots and dunder probes are off limits
+            if name not in DynamicPaths.__slots__ and not name.startswith('__'):
+                index = self._discover()
+                if name in index:
+                    return index[name]
+            raise AttributeError(f"'{class_name}' object has no attribute '{name}'")
+
         def __repr__(self):
             return f"{class_name}(base='{self.base}')"
-        
+
         def list_paths(self) -> List[str]:
             """List all available path attributes."""
-            return [attr for attr in dir(self) 
-                   if not attr.startswith('_') and attr != 'base' and attr != 'list_paths']
+            return sorted(self._discover())
     
     # Change class name
     DynamicPaths.__name__ = class_name
@@ -389,7 +485,25 @@ def create_dynamic_path_class(base_path: Union[str, Path],
     return DynamicPaths()
 
 
-def convert_to_project(folder_path: Union[str, Path], 
+# Attribute names that auto_discover_paths reports (at max_depth=2) when a
+# template's directory structure is fully present
+_TEMPLATE_EXPECTED_DIRS = {
+    "minimal": frozenset({
+        "data", "raw", "processed", "src",
+    }),
+    "simple": frozenset({
+        "data", "raw", "interim", "processed", "src", "plots", "notebooks",
+    }),
+    "full": frozenset({
+        "data", "raw", "interim", "processed",
+        "src", "features", "models", "visualization",
+        "plots", "exploratory", "publication",
+        "notebooks", "docs", "reports", "results", "config",
+    }),
+}
+
+
+def convert_to_project(folder_path: Union[str, Path],
                        template: str = "full",
                        auto_discover: bool = True) -> 'ProjectPaths':
     """
@@ -423,26 +537,39 @@ def convert_to_project(folder_path: Union[str, Path],
         >>> project.results_2025  # If "results_2025" folder exists
         >>> project.old_notebooks  # If "old_notebooks" folder exists
     """
-    from .projects import ProjectPaths
-    
+    from ..project.projects import ProjectPaths
+
     folder_path = Path(folder_path)
-    
+
     # Create ProjectPaths instance
     project = ProjectPaths(folder_path, auto_create=False)
-    
-    # Create standard structure if folders don't exist
+
+    # Create standard structure only if folders are actually missing --
+    # on an already-converted project this skips every mkdir syscall
     if template:
-        project.create_structure(template=template)
-    
-    # Auto-discover additional folders if requested
+        expected = _TEMPLATE_EXPECTED_DIRS.get(template)
+        discovered = auto_discover_paths(folder_path, max_depth=2)
+        structure_complete = (
+            expected is not None
+            and expected <= set(discovered)
+            and project.readme.exists()
+            and project.gitignore.exists()
+        )
+        if not structure_complete:
+            project.create_structure(template=template)
+
+    # Auto-discover additional folders if requested (immediate children only).
+    # This needs its own depth-1 scan: the depth-2 dict above keys on the
+    # sanitized name, so a top-level folder colliding with a nested one
+    # (e.g. 'Extra' vs 'Gamma/Extra') gets overwritten by the deeper entry
     if auto_discover:
-        discovered = auto_discover_paths(folder_path, max_depth=1)
-        
-        # Add discovered paths as attributes (avoid overwriting existing ones)
-        for attr_name, path in discovered.items():
+        for attr_name, path in auto_discover_paths(folder_path,
+                                                   max_depth=1).items():
+            # Add discovered paths as attributes (avoid overwriting existing
+            # ones); ProjectPaths is slotted, so they go in its _extra dict
             if not hasattr(project, attr_name):
-                setattr(project, attr_name, path)
-    
+                project._extra[attr_name] = path
+
     return project
 
 
@@ -1,6 +1,7 @@
-from .projects import ProjectPaths, create_project
+from .projects import ProjectPaths, create_project, create_projects
 
 __all__ = [
     "create_project",
+    "create_projects",
     "ProjectPaths",
-]
\ No newline at end of file
+]
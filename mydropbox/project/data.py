@@ -2,13 +2,27 @@ from pathlib import Path
 
 
 class DataPaths:
-    """Paths for data directories (raw, interim, processed)."""
+    """Paths for data directories (raw, interim, processed).
+
+    Subdirectory paths are built lazily on first access: an unset slot
+    raises AttributeError, __getattr__ computes the path and stores it
+    back into the slot, so later accesses are plain slot reads.
+    """
+
+    __slots__ = ("base", "raw", "interim", "processed")
+
+    _SUBDIRS = ("raw", "interim", "processed")
 
     def __init__(self, base_path: Path):
         self.base = base_path
-        self.raw = base_path / "raw"
-        self.interim = base_path / "interim"
-        self.processed = base_path / "processed"
+
+    def __getattr__(self, name):
+        if name in self._SUBDIRS:
+            value = self.base / name
+            setattr(self, name, value)
+            return value
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def __repr__(self):
-        return f"DataPaths('{self.base}')"
\ No newline at end of file
+        return f"DataPaths('{self.base}')"
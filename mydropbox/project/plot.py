@@ -1,12 +1,26 @@
 from pathlib import Path
 
 class PlotPaths:
-    """Paths for plot directories."""
+    """Paths for plot directories.
+
+    Subdirectory paths are built lazily on first access and cached in
+    their slots (see DataPaths).
+    """
+
+    __slots__ = ("base", "exploratory", "publication")
+
+    _SUBDIRS = ("exploratory", "publication")
 
     def __init__(self, base_path: Path):
         self.base = base_path
-        self.exploratory = base_path / "exploratory"
-        self.publication = base_path / "publication"
+
+    def __getattr__(self, name):
+        if name in self._SUBDIRS:
+            value = self.base / name
+            setattr(self, name, value)
+            return value
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def __repr__(self):
-        return f"PlotPaths('{self.base}')"
\ No newline at end of file
+        return f"PlotPaths('{self.base}')"
@@ -10,148 +10,21 @@ Author: Raphaël Bajon
 from pathlib import Path
 from typing import Optional, List, Dict
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+import fnmatch
 import json
+import os
 
 from .source import SourcePaths
 from .plot import PlotPaths
 from .data import DataPaths
 
 
-class ProjectPaths:
-    """
-    Manages paths within a research project with a standardized structure.
-    
-    Standard structure:
-    project_name/
-    ├── README.md
-    ├── data/
-    │   ├── raw/          # Original, immutable data
-    │   ├── interim/      # Intermediate transformed data
-    │   └── processed/    # Final data for analysis
-    ├── notebooks/        # Jupyter notebooks
-    ├── src/              # Source code (or 'code/')
-    │   ├── data/         # Scripts to download or generate data
-    │   ├── features/     # Scripts to turn raw data into features
-    │   ├── models/       # Scripts to train models
-    │   └── visualization/# Scripts to create visualizations
-    ├── plots/            # Generated figures and plots
-    │   ├── exploratory/  # EDA plots
-    │   └── publication/  # Publication-ready figures
-    ├── docs/             # Documentation
-    ├── reports/          # Generated analysis (HTML, PDF, LaTeX)
-    ├── results/          # Model outputs, predictions, etc.
-    └── config/           # Configuration files
-    
-    Attributes:
-        base: Base path to the project
-        data: Data directory with raw, interim, processed subdirs
-        notebooks: Jupyter notebooks
-        src: Source code directory
-        plots: Plots and figures
-        docs: Documentation
-        reports: Generated reports
-        results: Model results and outputs
-        config: Configuration files
-    """
-    
-    def __init__(self, base_path: Path, auto_create: bool = False):
-        """
-        Initialize project paths.
-        
-        Args:
-            base_path: Path to the project directory
-            auto_create: If True, create directory structure automatically
-        """
-        self.base = Path(base_path)
-        
-        # Main directories
-        self.data = DataPaths(self.base / "data")
-        self.notebooks = self.base / "notebooks"
-        self.src = SourcePaths(self.base / "src")
-        self.plots = PlotPaths(self.base / "plots")
-        self.docs = self.base / "docs"
-        self.reports = self.base / "reports"
-        self.results = self.base / "results"
-        self.config = self.base / "config"
-        
-        # Common files
-        self.readme = self.base / "README.md"
-        self.gitignore = self.base / ".gitignore"
-        self.requirements = self.base / "requirements.txt"
-        self.environment_yml = self.base / "environment.yml"
-        
-        if auto_create:
-            self.create_structure()
-    
-    def create_structure(self, template: str = "full"):
-        """
-        Create the project directory structure.
-        
-        Args:
-            template: Structure template to use
-                - "full": Complete data science structure (default)
-                - "simple": Basic structure (data, src, plots, notebooks)
-                - "minimal": Just data and src
-        """
-        if template == "minimal":
-            dirs = [
-                self.data.raw,
-                self.data.processed,
-                self.src.base,
-            ]
-        elif template == "simple":
-            dirs = [
-                self.data.raw,
-                self.data.interim,
-                self.data.processed,
-                self.src.base,
-                self.plots.base,
-                self.notebooks,
-            ]
-        else:  # full
-            dirs = [
-                # Data
-                self.data.raw,
-                self.data.interim,
-                self.data.processed,
-                # Source code
-                self.src.data,
-                self.src.features,
-                self.src.models,
-                self.src.visualization,
-                # Plots
-                self.plots.exploratory,
-                self.plots.publication,
-                # Other
-                self.notebooks,
-                self.docs,
-                self.reports,
-                self.results,
-                self.config,
-            ]
-        
-        # Create all directories
-        for directory in dirs:
-            directory.mkdir(parents=True, exist_ok=True)
-        
-        # Create README if it doesn't exist
-        if not self.readme.exists():
-            self._create_readme()
-        
-        # Create .gitignore if it doesn't exist
-        if not self.gitignore.exists():
-            self._create_gitignore()
-        
-        # Create __init__.py in src
-        src_init = self.src.base / "__init__.py"
-        if not src_init.exists():
-            src_init.write_text('"""Source code for the project."""\n')
-        
-        return self
-    
-    def _create_readme(self):
-        """Create a basic README.md template."""
-        template = f"""# {self.base.name}
+# File templates, built once at import. Only the project name and the
+# creation date vary per project, so the README is a format string and
+# the .gitignore is pre-encoded bytes.
+_README_TEMPLATE = """# {name}
 
 ## Project Overview
 
@@ -160,7 +33,7 @@ class ProjectPaths:
 ## Project Structure
 
 ```
-{self.base.name}/
+{name}/
 ├── data/
 │   ├── raw/          # Original, immutable data
 │   ├── interim/      # Intermediate data
@@ -201,13 +74,10 @@ class ProjectPaths:
 
 ## Date
 
-Created: {datetime.now().strftime('%Y-%m-%d')}
+Created: {date}
 """
-        self.readme.write_text(template)
-    
-    def _create_gitignore(self):
-        """Create a .gitignore for data science projects."""
-        template = """# Data files (too large for git)
+
+_GITIGNORE_BYTES = b"""# Data files (too large for git)
 data/raw/*
 data/interim/*
 data/processed/*
@@ -252,7 +122,287 @@ plots/exploratory/*
 config/secrets.yml
 config/local_config.yml
 """
-        self.gitignore.write_text(template)
+
+
+# Saver functions memoized per concrete data/figure type, so repeated
+# saves in a loop pay one attribute probe per type instead of a
+# hasattr chain per call.
+_SAVE_DISPATCH = {}
+_FIGURE_DISPATCH = {}
+
+
+def _resolve_dataset_saver(data_type):
+    """Pick the save routine for a dataset type (None if unknown)."""
+    if hasattr(data_type, 'to_netcdf'):  # xarray
+        return lambda data, path, **kw: data.to_netcdf(path, **kw)
+    if hasattr(data_type, 'to_csv'):  # pandas
+        return lambda data, path, **kw: data.to_csv(path, **kw)
+    if hasattr(data_type, 'save'):  # numpy, torch, etc.
+        return lambda data, path, **kw: data.save(str(path), **kw)
+    return None
+
+
+def _resolve_figure_saver(fig_type):
+    """Pick the save routine for a figure type (None if unknown)."""
+    if hasattr(fig_type, 'savefig'):  # matplotlib
+        return (lambda fig, path, dpi, **kw:
+                fig.savefig(path, dpi=dpi, bbox_inches='tight', **kw))
+    if hasattr(fig_type, 'write_image'):  # plotly
+        return lambda fig, path, dpi, **kw: fig.write_image(str(path), **kw)
+    return None
+
+
+def _write_if_absent(path: Path, data):
+    """Write data to path only if the file does not exist yet.
+
+    O_CREAT|O_EXCL makes the create itself the existence probe, instead
+    of a stat() followed by a second open. Pre-encoded bytes go straight
+    through a raw fd, skipping the buffered-writer layer entirely.
+    """
+    try:
+        if isinstance(data, bytes):
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+        else:
+            with open(path, 'x') as f:
+                f.write(data)
+    except FileExistsError:
+        pass
+
+
+class ProjectPaths:
+    """
+    Manages paths within a research project with a standardized structure.
+    
+    Standard structure:
+    project_name/
+    ├── README.md
+    ├── data/
+    │   ├── raw/          # Original, immutable data
+    │   ├── interim/      # Intermediate transformed data
+    │   └── processed/    # Final data for analysis
+    ├── notebooks/        # Jupyter notebooks
+    ├── src/              # Source code (or 'code/')
+    │   ├── data/         # Scripts to download or generate data
+    │   ├── features/     # Scripts to turn raw data into features
+    │   ├── models/       # Scripts to train models
+    │   └── visualization/# Scripts to create visualizations
+    ├── plots/            # Generated figures and plots
+    │   ├── exploratory/  # EDA plots
+    │   └── publication/  # Publication-ready figures
+    ├── docs/             # Documentation
+    ├── reports/          # Generated analysis (HTML, PDF, LaTeX)
+    ├── results/          # Model outputs, predictions, etc.
+    └── config/           # Configuration files
+    
+    Attributes:
+        base: Base path to the project
+        data: Data directory with raw, interim, processed subdirs
+        notebooks: Jupyter notebooks
+        src: Source code directory
+        plots: Plots and figures
+        docs: Documentation
+        reports: Generated reports
+        results: Model results and outputs
+        config: Configuration files
+    """
+
+    __slots__ = (
+        "base", "data", "notebooks", "src", "plots", "docs", "reports",
+        "results", "config", "readme", "gitignore", "requirements",
+        "environment_yml", "_ensured_dirs", "_extra",
+        "_data_locs", "_fig_locs", "_listdir_cache",
+    )
+
+    def __init__(self, base_path: Path, auto_create: bool = False):
+        """
+        Initialize project paths.
+        
+        Args:
+            base_path: Path to the project directory
+            auto_create: If True, create directory structure automatically
+        """
+        self.base = Path(base_path)
+
+        # Main directories (data/src/plots are built lazily in __getattr__)
+        self.notebooks = self.base / "notebooks"
+        self.docs = self.base / "docs"
+        self.reports = self.base / "reports"
+        self.results = self.base / "results"
+        self.config = self.base / "config"
+        
+        # Common files
+        self.readme = self.base / "README.md"
+        self.gitignore = self.base / ".gitignore"
+        self.requirements = self.base / "requirements.txt"
+        self.environment_yml = self.base / "environment.yml"
+
+        # Directories known to exist; lets repeated saves skip mkdir syscalls
+        self._ensured_dirs = set()
+
+        # Extra paths attached after construction (e.g. auto-discovered
+        # folders in convert_to_project); served through __getattr__
+        self._extra = {}
+
+        # (dir, pattern) -> (dir mtime_ns, listing); lets repeated
+        # list_datasets calls skip the scan while the directory is unchanged
+        self._listdir_cache = {}
+
+        if auto_create:
+            self.create_structure()
+
+    # Sub-path containers, built on first access. Scripts that only
+    # touch e.g. project.data never pay for SourcePaths/PlotPaths.
+    _LAZY_SUBPATHS = {"data": DataPaths, "src": SourcePaths, "plots": PlotPaths}
+
+    # Directories each structure template creates, as attribute paths;
+    # the attrgetters are built once at class creation
+    _TEMPLATES = {
+        "minimal": (
+            "data.raw",
+            "data.processed",
+            "src.base",
+        ),
+        "simple": (
+            "data.raw",
+            "data.interim",
+            "data.processed",
+            "src.base",
+            "plots.base",
+            "notebooks",
+        ),
+        "full": (
+            # Data
+            "data.raw",
+            "data.interim",
+            "data.processed",
+            # Source code
+            "src.data",
+            "src.features",
+            "src.models",
+            "src.visualization",
+            # Plots
+            "plots.exploratory",
+            "plots.publication",
+            # Other
+            "notebooks",
+            "docs",
+            "reports",
+            "results",
+            "config",
+        ),
+    }
+    _TEMPLATE_GETTERS = {
+        name: tuple(attrgetter(attr) for attr in attrs)
+        for name, attrs in _TEMPLATES.items()
+    }
+
+    def __getattr__(self, name):
+        # Discovered names in _extra may start with '_' (dated folders);
+        # only guard _extra itself against recursing before __init__ set it
+        if name != "_extra":
+            cls = self._LAZY_SUBPATHS.get(name)
+            if cls is not None:
+                value = cls(self.base / name)
+                setattr(self, name, value)
+                return value
+            try:
+                return self._extra[name]
+            except KeyError:
+                pass
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _data_locations(self) -> Dict[str, Path]:
+        """Location-name -> data directory map, built on first use."""
+        try:
+            return self._data_locs
+        except AttributeError:
+            self._data_locs = {
+                "raw": self.data.raw,
+                "interim": self.data.interim,
+                "processed": self.data.processed,
+            }
+            return self._data_locs
+
+    def _figure_locations(self) -> Dict[str, Path]:
+        """Location-name -> plots directory map, built on first use."""
+        try:
+            return self._fig_locs
+        except AttributeError:
+            self._fig_locs = {
+                "exploratory": self.plots.exploratory,
+                "publication": self.plots.publication,
+            }
+            return self._fig_locs
+
+    def _ensure_dir(self, path: Path):
+        """Create a directory if this instance hasn't already; cached in a set."""
+        if path not in self._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._ensured_dirs.add(path)
+
+    def create_structure(self, template: str = "full"):
+        """
+        Create the project directory structure.
+        
+        Args:
+            template: Structure template to use
+                - "full": Complete data science structure (default)
+                - "simple": Basic structure (data, src, plots, notebooks)
+                - "minimal": Just data and src
+        """
+        getters = self._TEMPLATE_GETTERS.get(template,
+                                             self._TEMPLATE_GETTERS["full"])
+        dirs = [getter(self) for getter in getters]
+
+        # Create all directories. The template leaves share parents
+        # (data/raw, data/interim, ... all re-traverse data/), so collect
+        # every directory up to the project base once, create them
+        # shallowest-first, and let mkdir itself serve as the existence
+        # probe instead of a separate stat per level.
+        os.makedirs(self.base, exist_ok=True)
+
+        all_dirs = set()
+        for directory in dirs:
+            while directory != self.base and self.base in directory.parents:
+                all_dirs.add(directory)
+                directory = directory.parent
+
+        for directory in sorted(all_dirs, key=lambda p: len(p.parts)):
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
+
+        # Everything above is now known to exist
+        self._ensured_dirs.add(self.base)
+        self._ensured_dirs.update(all_dirs)
+        
+        # Create README, .gitignore and src/__init__.py if absent;
+        # one timestamp covers the whole invocation
+        self._create_readme(now=datetime.now())
+        self._create_gitignore()
+        _write_if_absent(self.src.base / "__init__.py",
+                         '"""Source code for the project."""\n')
+
+        return self
+    
+    def _create_readme(self, now: Optional[datetime] = None):
+        """Create a basic README.md template (no-op if one exists)."""
+        if now is None:
+            now = datetime.now()
+        _write_if_absent(self.readme, _README_TEMPLATE.format(
+            name=self.base.name,
+            date=now.strftime('%Y-%m-%d'),
+        ))
+
+    def _create_gitignore(self):
+        """Create a .gitignore for data science projects (no-op if one exists)."""
+        _write_if_absent(self.gitignore, _GITIGNORE_BYTES)
     
     def save_dataset(self, data, filename: str, location: str = "processed", **kwargs):
         """
@@ -264,25 +414,29 @@ config/local_config.yml
             location: Where to save - "raw", "interim", or "processed"
             **kwargs: Additional arguments passed to the save method
         """
-        if location == "raw":
-            path = self.data.raw / filename
-        elif location == "interim":
-            path = self.data.interim / filename
-        elif location == "processed":
-            path = self.data.processed / filename
-        else:
-            raise ValueError(f"Unknown location: {location}")
-        
-        # Try different save methods based on data type
-        if hasattr(data, 'to_netcdf'):  # xarray
-            data.to_netcdf(path, **kwargs)
-        elif hasattr(data, 'to_csv'):  # pandas
-            data.to_csv(path, **kwargs)
-        elif hasattr(data, 'save'):  # numpy, torch, etc.
-            data.save(str(path), **kwargs)
-        else:
-            raise TypeError(f"Don't know how to save {type(data)}")
-        
+        try:
+            path = self._data_locations()[location] / filename
+        except KeyError:
+            raise ValueError(f"Unknown location: {location}") from None
+
+        self._ensure_dir(path.parent)
+
+        # Dispatch on the concrete type, resolved once per type
+        data_type = type(data)
+        saver = _SAVE_DISPATCH.get(data_type)
+        if saver is None:
+            saver = _resolve_dataset_saver(data_type)
+            if saver is None:
+                raise TypeError(f"Don't know how to save {data_type}")
+            _SAVE_DISPATCH[data_type] = saver
+        saver(data, path, **kwargs)
+
+        # The target directory changed; drop its cached listings
+        if self._listdir_cache:
+            parent = path.parent
+            for key in [k for k in self._listdir_cache if k[0] == parent]:
+                del self._listdir_cache[key]
+
         return path
     
     def save_figure(self, fig, filename: str, location: str = "exploratory", 
@@ -297,22 +451,19 @@ config/local_config.yml
             dpi: Resolution (default 300 for publication quality)
             **kwargs: Additional arguments for savefig
         """
-        if location == "exploratory":
-            path = self.plots.exploratory / filename
-        elif location == "publication":
-            path = self.plots.publication / filename
-        else:
-            path = self.plots.base / filename
-        
-        path.parent.mkdir(parents=True, exist_ok=True)
-        
-        if hasattr(fig, 'savefig'):  # matplotlib
-            fig.savefig(path, dpi=dpi, bbox_inches='tight', **kwargs)
-        elif hasattr(fig, 'write_image'):  # plotly
-            fig.write_image(str(path), **kwargs)
-        else:
-            raise TypeError(f"Don't know how to save {type(fig)}")
+        path = self._figure_locations().get(location, self.plots.base) / filename
         
+        self._ensure_dir(path.parent)
+
+        fig_type = type(fig)
+        saver = _FIGURE_DISPATCH.get(fig_type)
+        if saver is None:
+            saver = _resolve_figure_saver(fig_type)
+            if saver is None:
+                raise TypeError(f"Don't know how to save {fig_type}")
+            _FIGURE_DISPATCH[fig_type] = saver
+        saver(fig, path, dpi, **kwargs)
+
         return path
     
     def list_datasets(self, location: str = "all", pattern: str = "*") -> Dict[str, List[Path]]:
@@ -327,45 +478,95 @@ config/local_config.yml
             Dictionary mapping location to list of files
         """
         results = {}
-        
-        if location in ["raw", "all"]:
-            results["raw"] = sorted(self.data.raw.glob(pattern))
-        if location in ["interim", "all"]:
-            results["interim"] = sorted(self.data.interim.glob(pattern))
-        if location in ["processed", "all"]:
-            results["processed"] = sorted(self.data.processed.glob(pattern))
-        
+
+        for loc, root in self._data_locations().items():
+            if location in (loc, "all"):
+                results[loc] = self._list_dir(root, pattern)
+
         return results
+
+    def _list_dir(self, root: Path, pattern: str) -> List[Path]:
+        """List datasets in one directory, sorted by name.
+
+        Uses os.scandir rather than Path.glob in a single pass with no
+        per-entry stat. Like Path.glob, every entry is kept — datasets
+        such as zarr stores are directories. Results are cached against
+        the directory's mtime, so re-listing an unchanged directory
+        costs one stat instead of a full scan.
+        """
+        try:
+            mtime = os.stat(root).st_mtime_ns
+        except OSError:
+            return []
+
+        key = (root, pattern)
+        cached = self._listdir_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+
+        try:
+            with os.scandir(root) as entries:
+                names = sorted(e.name for e in entries)
+        except OSError:
+            return []
+        if pattern != "*":
+            names = fnmatch.filter(names, pattern)
+        paths = [root / name for name in names]
+        self._listdir_cache[key] = (mtime, paths)
+        return list(paths)
     
-    def create_metadata(self, description: str = "", author: str = "", 
-                       tags: List[str] = None):
+    def create_metadata(self, description: str = "", author: str = "",
+                       tags: List[str] = None, now: Optional[datetime] = None):
         """
         Create a metadata file for the project.
-        
+
         Args:
             description: Project description
             author: Project author
             tags: List of tags/keywords
+            now: Creation timestamp (defaults to datetime.now())
         """
         metadata = {
             "name": self.base.name,
             "description": description,
             "author": author,
-            "created": datetime.now().isoformat(),
+            "created": (now or datetime.now()).isoformat(),
             "tags": tags or [],
             "structure_version": "1.0",
         }
         
+        # Serialize in one go and write with a single syscall, instead of
+        # json.dump streaming many small writes through a text wrapper
+        blob = json.dumps(metadata, indent=2, separators=(',', ': '),
+                          ensure_ascii=False).encode('utf-8')
         metadata_file = self.base / "project_metadata.json"
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
-        
+        metadata_file.write_bytes(blob)
+
         return metadata_file
     
-    def __repr__(self):
+    def status(self) -> str:
+        """Return the repr-style summary including an existence check.
+
+        Kept out of __repr__ so printing a project (or tab-completing it
+        in a REPL) never blocks on a stat against a network mount.
+        """
         exists = "✓" if self.base.exists() else "✗"
         return f"ProjectPaths({exists} '{self.base.name}')"
 
+    def __repr__(self):
+        return f"ProjectPaths('{self.base.name}')"
+
+
+@lru_cache(maxsize=128)
+def _get_project_paths(base_str: str, auto_create: bool = False) -> ProjectPaths:
+    """Shared ProjectPaths factory, memoized on the path string.
+
+    Re-running a notebook cell that builds the same project returns the
+    cached instance instead of re-allocating every subpath. Call
+    ``_get_project_paths.cache_clear()`` to drop cached instances.
+    """
+    return ProjectPaths(Path(base_str), auto_create=auto_create)
+
 
 # Convenience function to create a new project
 def create_project(base_path: Path, name: str, template: str = "full",
@@ -396,15 +597,49 @@ def create_project(base_path: Path, name: str, template: str = "full",
         >>> # Now use project.data.raw, project.src, etc.
     """
     project_path = base_path / name
-    project = ProjectPaths(project_path, auto_create=False)
+    project = _get_project_paths(str(project_path))
     project.create_structure(template=template)
     
     if description or author:
         project.create_metadata(description=description, author=author)
-    
+
     return project
 
 
+def create_projects(base_path: Path, names: List[str], template: str = "full",
+                    description: str = "", author: str = "",
+                    max_workers: int = 16) -> List[ProjectPaths]:
+    """
+    Create several projects concurrently.
+
+    The mkdir/write syscalls release the GIL, so a thread pool overlaps
+    them across projects — worthwhile when scripting creation of many
+    projects on a network-mounted Dropbox.
+
+    Args:
+        base_path: Where to create the projects
+        names: Project names, one project per name
+        template: "full", "simple", or "minimal"
+        description: Project description (shared by all projects)
+        author: Project author
+        max_workers: Thread pool size
+
+    Returns:
+        List of ProjectPaths instances, in the same order as names
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if not names:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(names))) as pool:
+        return list(pool.map(
+            lambda name: create_project(base_path, name, template=template,
+                                        description=description, author=author),
+            names,
+        ))
+
+
 if __name__ == "__main__":
     # Demo
     print("Project Structure Demo")
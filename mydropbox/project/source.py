@@ -2,14 +2,27 @@ from pathlib import Path
 
 
 class SourcePaths:
-    """Paths for source code directories."""
+    """Paths for source code directories.
+
+    Subdirectory paths (data loading, feature engineering, model
+    training, plotting) are built lazily on first access and cached in
+    their slots (see DataPaths).
+    """
+
+    __slots__ = ("base", "data", "features", "models", "visualization")
+
+    _SUBDIRS = ("data", "features", "models", "visualization")
 
     def __init__(self, base_path: Path):
         self.base = base_path
-        self.data = base_path / "data"  # Data loading/processing
-        self.features = base_path / "features"  # Feature engineering
-        self.models = base_path / "models"  # Model training
-        self.visualization = base_path / "visualization"  # Plotting
+
+    def __getattr__(self, name):
+        if name in self._SUBDIRS:
+            value = self.base / name
+            setattr(self, name, value)
+            return value
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def __repr__(self):
-        return f"SourcePaths('{self.base}')"
\ No newline at end of file
+        return f"SourcePaths('{self.base}')"
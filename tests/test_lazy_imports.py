@@ -0,0 +1,32 @@
+"""Regression tests for the lazy top-level imports (PEP 562)."""
+
+import subprocess
+import sys
+
+
+def _run_fresh(code: str):
+    """Run a snippet in a fresh interpreter so import order is controlled."""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_get_dropbox_before_dropbox_instance():
+    # Resolving a .dropbox-provided name first must not leave the
+    # subpackage module shadowing the lazy default instance.
+    _run_fresh(
+        "import mydropbox\n"
+        "from types import ModuleType\n"
+        "from mydropbox import check_sync_status\n"
+        "assert not isinstance(mydropbox.dropbox, ModuleType), 'module shadowed instance'\n"
+        "assert hasattr(mydropbox.dropbox, 'base_path')\n"
+    )
+
+
+def test_dropbox_instance_survives_later_lazy_imports():
+    _run_fresh(
+        "import mydropbox\n"
+        "from types import ModuleType\n"
+        "instance = mydropbox.dropbox\n"
+        "from mydropbox import check_sync_status, ProjectPaths\n"
+        "assert mydropbox.dropbox is instance\n"
+        "assert not isinstance(mydropbox.dropbox, ModuleType)\n"
+    )